@@ -66,9 +66,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Fetch initial data
     await coordinator.async_config_entry_first_refresh()
 
-    # Set up the interval timer
-    coordinator.async_setup_interval()
-
     # Store coordinator
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
@@ -101,15 +98,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     Returns:
         True if unload was successful.
     """
-    # Unload coordinator
-    coordinator: TrannergyDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    coordinator.async_unload()
-
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+    # Release the coordinator even if a platform failed to unload
+    coordinator: TrannergyDataUpdateCoordinator | None = hass.data[DOMAIN].pop(
+        entry.entry_id, None
+    )
+    if coordinator is not None:
+        await coordinator.async_shutdown()
 
     return unload_ok
 
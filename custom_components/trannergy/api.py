@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import socket
 import struct
 from typing import Any
 
@@ -13,6 +14,59 @@ _LOGGER = logging.getLogger(__name__)
 CONNECTION_TIMEOUT = 10
 READ_TIMEOUT = 10
 
+# TCP keepalive settings, detecting a dead connection within READ_TIMEOUT
+KEEPALIVE_IDLE = 5
+KEEPALIVE_INTERVAL = 1
+KEEPALIVE_COUNT = 3
+
+# Minimum length of a valid response from the inverter (bytes)
+MIN_RESPONSE_LENGTH = 80
+
+# Start byte of each frame, followed by a byte with the payload length
+FRAME_START = 0x68
+FRAME_HEADER_LENGTH = 2
+# Bytes in a frame besides the payload: start byte, length, control code,
+# module serial (twice), checksum and end byte
+FRAME_OVERHEAD = 14
+
+# Layout of the response frame after the frame header, unpacked in a single
+# call: 13 bytes, 16 byte inverter serial, temperature (offset 29),
+# 19 shorts for DC/AC readings and energy today (offsets 31-67),
+# energy total (offset 69) and hours total (offset 73)
+_FRAME = struct.Struct("!13x16s20H2I")
+
+# Sensor data reported while the inverter is offline
+_OFFLINE_DATA: dict[str, Any] = {
+    "status": "Offline",
+    "actualpower": 0.0,
+    "energytoday": 0.0,
+    "energytotal": 0.0,
+    "hourstotal": 0.0,
+    "invertersn": "",
+    "temperature": 0.0,
+    # Channel 1
+    "dcinputvoltage1": 0.0,
+    "dcinputcurrent1": 0.0,
+    "acoutputvoltage1": 0.0,
+    "acoutputcurrent1": 0.0,
+    "acoutputfrequency1": 0.0,
+    "acoutputpower1": 0.0,
+    # Channel 2
+    "dcinputvoltage2": 0.0,
+    "dcinputcurrent2": 0.0,
+    "acoutputvoltage2": 0.0,
+    "acoutputcurrent2": 0.0,
+    "acoutputfrequency2": 0.0,
+    "acoutputpower2": 0.0,
+    # Channel 3
+    "dcinputvoltage3": 0.0,
+    "dcinputcurrent3": 0.0,
+    "acoutputvoltage3": 0.0,
+    "acoutputcurrent3": 0.0,
+    "acoutputfrequency3": 0.0,
+    "acoutputpower3": 0.0,
+}
+
 
 class TrannergyInverterError(Exception):
     """Base exception for Trannergy Inverter errors."""
@@ -22,10 +76,6 @@ class TrannergyInverterConnectionError(TrannergyInverterError):
     """Connection error to the inverter."""
 
 
-class TrannergyInverterTimeoutError(TrannergyInverterError):
-    """Timeout error when connecting to the inverter."""
-
-
 class TrannergyInverterApi:
     """Async API client for Trannergy PV Inverter."""
 
@@ -40,7 +90,14 @@ class TrannergyInverterApi:
         self._host = host
         self._port = port
         self._serial_number = serial_number
-        self._raw_msg: bytes | None = None
+        self._request = self._generate_request(serial_number)
+        # Response frame read by the last request, without the frame header
+        self._payload = b""
+        self._sn_cache: tuple[bytes, str] | None = None
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+        self._last_error: str | None = None
 
     @staticmethod
     def _generate_request(serial_number: int) -> bytes:
@@ -59,44 +116,92 @@ class TrannergyInverterApi:
         Returns:
             Information request bytes for inverter
         """
-        double_hex = hex(serial_number)[2:] * 2
-        serial_bytes = bytearray.fromhex(double_hex)
-        serial_bytes.reverse()
+        # Little-endian bytes are the reversed hex notation of the serial
+        serial_bytes = serial_number.to_bytes(4, "little") * 2
+        checksum = (115 + sum(serial_bytes)) & 0xFF
 
-        cs_count = 115 + sum(serial_bytes)
-        checksum = bytearray.fromhex(hex(cs_count)[-2:])
+        request_data = (
+            b"\x68\x02\x40\x30"
+            + serial_bytes
+            + bytes((0x01, 0x00, checksum, 0x16))
+        )
 
-        request_data = bytearray([0x68, 0x02, 0x40, 0x30])
-        request_data.extend(serial_bytes)
-        request_data.extend([0x01, 0x00])
-        request_data.extend(checksum)
-        request_data.append(0x16)
-
-        _LOGGER.debug("Request: %s", request_data.hex(" "))
-        return bytes(request_data)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Request: %s", request_data.hex(" "))
+        return request_data
 
     async def async_get_data(self) -> dict[str, Any]:
         """Fetch data from the inverter.
 
+        The connection to the inverter is kept open between calls. If a reused
+        connection turns out to be dropped, a new one is opened once. A read
+        timeout is not retried. Concurrent calls are serialized on the
+        connection.
+
+        An inverter that cannot be reached is expected, e.g. at night, so no
+        exception is raised for it. Offline data is returned instead and
+        last_error describes the failure.
+
         Returns:
             Dictionary with all sensor data.
+        """
+        # Requests share one connection, so only one may be in flight
+        async with self._lock:
+            self._last_error = None
+            reused = self._writer is not None and not self._writer.is_closing()
 
-        Raises:
-            TrannergyInverterConnectionError: If connection fails.
-            TrannergyInverterTimeoutError: If connection times out.
+            try:
+                success = await self._async_exchange()
+                if reused and not success:
+                    # Many inverters close idle connections, retry on a fresh one
+                    _LOGGER.debug("Connection to inverter was dropped, reconnecting")
+                    self._last_error = None
+                    success = await self._async_exchange()
+            except asyncio.TimeoutError:
+                # An inverter that does not answer is offline, don't retry
+                _LOGGER.debug("Timeout reading data from inverter")
+                self._last_error = "Timeout reading data from inverter"
+                return self.get_offline_data()
+
+            if not success:
+                return self.get_offline_data()
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Response: %s", self._payload.hex(" "))
+            return self._parse_data()
+
+    @property
+    def serial_number(self) -> int:
+        """Return the serial number of the wifi/lan module."""
+        return self._serial_number
+
+    @property
+    def last_error(self) -> str | None:
+        """Return why the last data request could not reach the inverter."""
+        return self._last_error
+
+    async def _async_connect(self) -> bool:
+        """Open the connection to the inverter, unless it is open already.
+
+        Returns:
+            True if connected, False if the connection failed.
         """
+        if self._writer is not None and not self._writer.is_closing():
+            return True
+
         try:
-            reader, writer = await asyncio.wait_for(
+            self._reader, self._writer = await asyncio.wait_for(
                 asyncio.open_connection(self._host, self._port),
                 timeout=CONNECTION_TIMEOUT,
             )
-        except asyncio.TimeoutError as err:
+        except asyncio.TimeoutError:
             _LOGGER.debug(
                 "Timeout connecting to inverter at %s:%s", self._host, self._port
             )
-            raise TrannergyInverterTimeoutError(
+            self._last_error = (
                 f"Timeout connecting to inverter at {self._host}:{self._port}"
-            ) from err
+            )
+            return False
         except OSError as err:
             _LOGGER.debug(
                 "Could not connect to inverter at %s:%s: %s",
@@ -104,37 +209,107 @@ class TrannergyInverterApi:
                 self._port,
                 err,
             )
-            raise TrannergyInverterConnectionError(
+            self._last_error = (
                 f"Could not connect to inverter at {self._host}:{self._port}"
-            ) from err
+            )
+            return False
+
+        sock = self._writer.get_extra_info("socket")
+        if sock is not None:
+            self._configure_socket(sock)
+
+        return True
+
+    @staticmethod
+    def _configure_socket(sock: socket.socket) -> None:
+        """Disable Nagle and enable keepalive on the inverter socket.
+
+        Args:
+            sock: Socket of the connection to the inverter.
+        """
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # The fine grained keepalive options are not available on all platforms
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE)
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                sock.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL
+                )
+            if hasattr(socket, "TCP_KEEPCNT"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, KEEPALIVE_COUNT)
+        except OSError as err:
+            _LOGGER.debug("Could not set socket options: %s", err)
+
+    async def _async_exchange(self) -> bool:
+        """Send the request to the inverter and read the response frame.
+
+        Exactly one frame is read, as announced by its header, so no bytes of
+        it are left on the connection for the next request. The frame is
+        kept, without its header, for parsing.
+
+        Returns:
+            True if a frame was read, False if the exchange failed.
+
+        Raises:
+            asyncio.TimeoutError: If the inverter does not respond in time.
+        """
+        self._payload = b""
+        if not await self._async_connect():
+            return False
 
         try:
-            request = self._generate_request(self._serial_number)
-            writer.write(request)
-            await writer.drain()
+            self._writer.write(self._request)
+            await self._writer.drain()
 
-            self._raw_msg = await asyncio.wait_for(
-                reader.read(1024), timeout=READ_TIMEOUT
+            header = await asyncio.wait_for(
+                self._reader.readexactly(FRAME_HEADER_LENGTH), timeout=READ_TIMEOUT
+            )
+            if header[0] != FRAME_START:
+                # Out of step with the frames on the connection, start over
+                _LOGGER.debug("Invalid frame header from inverter: %s", header.hex(" "))
+                self._last_error = "Invalid response from inverter"
+                await self.async_close()
+                return False
+
+            # The frame may arrive in more than one segment
+            self._payload = await asyncio.wait_for(
+                self._reader.readexactly(
+                    header[1] + FRAME_OVERHEAD - FRAME_HEADER_LENGTH
+                ),
+                timeout=READ_TIMEOUT,
             )
-            _LOGGER.debug("Response: %s", self._raw_msg.hex(" ") if self._raw_msg else "None")
-        except asyncio.TimeoutError as err:
-            _LOGGER.debug("Timeout reading data from inverter")
-            raise TrannergyInverterTimeoutError(
-                "Timeout reading data from inverter"
-            ) from err
+        except asyncio.IncompleteReadError:
+            # End of stream, the inverter closed the connection
+            _LOGGER.debug("Inverter closed the connection")
+            self._last_error = "Inverter closed the connection"
+            await self.async_close()
+            return False
+        except asyncio.TimeoutError:
+            await self.async_close()
+            raise
         except OSError as err:
             _LOGGER.debug("Error reading data from inverter: %s", err)
-            raise TrannergyInverterConnectionError(
-                f"Error reading data from inverter: {err}"
-            ) from err
-        finally:
-            writer.close()
-            try:
-                await writer.wait_closed()
-            except Exception:  # noqa: BLE001
-                pass
+            self._last_error = f"Error reading data from inverter: {err}"
+            await self.async_close()
+            return False
+
+        return True
 
-        return self._parse_data()
+    async def async_close(self) -> None:
+        """Close the connection to the inverter, if open."""
+        writer = self._writer
+        self._reader = None
+        self._writer = None
+        if writer is None:
+            return
+
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:  # noqa: BLE001
+            pass
 
     def _parse_data(self) -> dict[str, Any]:
         """Parse the raw message into sensor data.
@@ -142,166 +317,95 @@ class TrannergyInverterApi:
         Returns:
             Dictionary with all sensor data.
         """
-        data: dict[str, Any] = {}
-
         # Check if we have valid data
-        if not self._raw_msg or len(self._raw_msg) < 80:
+        if len(self._payload) < MIN_RESPONSE_LENGTH - FRAME_HEADER_LENGTH:
             _LOGGER.debug("Invalid or empty response from inverter")
-            return self._get_offline_data()
+            return self.get_offline_data()
 
         # Check if inverter is online by checking temperature
-        temperature = self._get_short(31)
+        # Read through a view to avoid copying the slice
+        with memoryview(self._payload) as view:
+            temperature_raw = int.from_bytes(view[29:31], "big")
+        temperature = None if temperature_raw == 65535 else temperature_raw / 10
         if temperature is None or temperature > 150:
             _LOGGER.debug("Inverter appears to be offline (temperature: %s)", temperature)
-            return self._get_offline_data()
-
-        # Status
-        data["status"] = "Online"
-
-        # Power and energy
-        data["actualpower"] = self._safe_float(self._get_short(59, 1), 0.0)
-        data["energytoday"] = self._safe_float(self._get_short(69, 100), 0.0)
-        data["energytotal"] = self._safe_float(self._get_long(71), 0.0)
-        data["hourstotal"] = self._safe_float(self._get_long(75, 1), 0.0)
-
-        # Inverter serial
-        data["invertersn"] = self._get_string(15, 31) or ""
-
-        # Temperature
-        data["temperature"] = self._safe_float(temperature, 0.0)
-
-        # DC Input (3 channels)
-        for i in range(1, 4):
-            data[f"dcinputvoltage{i}"] = self._safe_float(
-                self._get_short(33 + (i - 1) * 2), 0.0
-            )
-            data[f"dcinputcurrent{i}"] = self._safe_float(
-                self._get_short(39 + (i - 1) * 2), 0.0
-            )
-
-        # AC Output (3 channels)
-        for i in range(1, 4):
-            data[f"acoutputvoltage{i}"] = self._safe_float(
-                self._get_short(51 + (i - 1) * 2), 0.0
-            )
-            data[f"acoutputcurrent{i}"] = self._safe_float(
-                self._get_short(45 + (i - 1) * 2), 0.0
-            )
-            data[f"acoutputfrequency{i}"] = self._safe_float(
-                self._get_short(57 + (i - 1) * 4, 100), 0.0
-            )
-            data[f"acoutputpower{i}"] = self._safe_float(
-                self._get_short(59 + (i - 1) * 4, 1), 0.0
-            )
-
-        return data
-
-    def _get_offline_data(self) -> dict[str, Any]:
-        """Return data structure for offline inverter.
+            return self.get_offline_data()
+
+        fields = _FRAME.unpack_from(self._payload, 0)
+        # Shorts at offsets 31-67, with the 0xFFFF "no value" marker mapped to 0
+        (
+            dc_voltage1,
+            dc_voltage2,
+            dc_voltage3,
+            dc_current1,
+            dc_current2,
+            dc_current3,
+            ac_current1,
+            ac_current2,
+            ac_current3,
+            ac_voltage1,
+            ac_voltage2,
+            ac_voltage3,
+            ac_frequency1,
+            ac_power1,
+            ac_frequency2,
+            ac_power2,
+            ac_frequency3,
+            ac_power3,
+            energy_today,
+        ) = [0.0 if num == 65535 else float(num) for num in fields[2:21]]
+
+        # Inverter serial, only decoded again when the raw bytes change
+        sn_raw = fields[0]
+        if self._sn_cache is not None and self._sn_cache[0] == sn_raw:
+            inverter_sn = self._sn_cache[1]
+        else:
+            try:
+                inverter_sn = sn_raw.decode().strip("\x00")
+            except UnicodeDecodeError:
+                inverter_sn = ""
+            self._sn_cache = (sn_raw, inverter_sn)
 
-        Returns:
-            Dictionary with all sensor data set to offline/zero values.
-        """
         data: dict[str, Any] = {
-            "status": "Offline",
-            "actualpower": 0.0,
-            "energytoday": 0.0,
-            "energytotal": 0.0,
-            "hourstotal": 0.0,
-            "invertersn": "",
-            "temperature": 0.0,
+            "status": "Online",
+            # Power and energy
+            "actualpower": ac_power1,
+            "energytoday": energy_today / 100,
+            "energytotal": float(fields[21]) / 10,
+            "hourstotal": float(fields[22]),
+            "invertersn": inverter_sn,
+            "temperature": temperature,
+            # DC Input (3 channels)
+            "dcinputvoltage1": dc_voltage1 / 10,
+            "dcinputcurrent1": dc_current1 / 10,
+            "dcinputvoltage2": dc_voltage2 / 10,
+            "dcinputcurrent2": dc_current2 / 10,
+            "dcinputvoltage3": dc_voltage3 / 10,
+            "dcinputcurrent3": dc_current3 / 10,
+            # AC Output (3 channels)
+            "acoutputvoltage1": ac_voltage1 / 10,
+            "acoutputcurrent1": ac_current1 / 10,
+            "acoutputfrequency1": ac_frequency1 / 100,
+            "acoutputpower1": ac_power1,
+            "acoutputvoltage2": ac_voltage2 / 10,
+            "acoutputcurrent2": ac_current2 / 10,
+            "acoutputfrequency2": ac_frequency2 / 100,
+            "acoutputpower2": ac_power2,
+            "acoutputvoltage3": ac_voltage3 / 10,
+            "acoutputcurrent3": ac_current3 / 10,
+            "acoutputfrequency3": ac_frequency3 / 100,
+            "acoutputpower3": ac_power3,
         }
 
-        for i in range(1, 4):
-            data[f"dcinputvoltage{i}"] = 0.0
-            data[f"dcinputcurrent{i}"] = 0.0
-            data[f"acoutputvoltage{i}"] = 0.0
-            data[f"acoutputcurrent{i}"] = 0.0
-            data[f"acoutputfrequency{i}"] = 0.0
-            data[f"acoutputpower{i}"] = 0.0
-
         return data
 
-    @staticmethod
-    def _safe_float(value: float | None, default: float) -> float:
-        """Safely convert value to float.
-
-        Args:
-            value: Value to convert.
-            default: Default value if conversion fails.
-
-        Returns:
-            Float value or default.
-        """
-        if value is None:
-            return default
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return default
-
-    def _get_string(self, begin: int, end: int) -> str | None:
-        """Extract string from message.
-
-        Args:
-            begin: Starting byte index of string.
-            end: End byte index of string.
-
-        Returns:
-            String in the message from start to end.
-        """
-        try:
-            if self._raw_msg:
-                return self._raw_msg[begin:end].decode().strip("\x00")
-        except (UnicodeDecodeError, IndexError):
-            pass
-        return None
-
-    def _get_short(self, begin: int, divider: int = 10) -> float | None:
-        """Extract short from message.
-
-        The shorts in the message could be a decimal number, stored multiplied.
-        Dividing retrieves the original decimal number.
-
-        Args:
-            begin: Index of short in message.
-            divider: Divider to change short to float.
-
-        Returns:
-            Value stored at location begin.
-        """
-        try:
-            if self._raw_msg:
-                num = struct.unpack("!H", self._raw_msg[begin : begin + 2])[0]
-                if num == 65535:
-                    return None
-                return float(num) / divider
-        except (struct.error, IndexError):
-            pass
-        return None
-
-    def _get_long(self, begin: int, divider: int = 10) -> float | None:
-        """Extract long from message.
-
-        The longs in the message could be a decimal number.
-        Dividing retrieves the original decimal number.
-
-        Args:
-            begin: Index of long in message.
-            divider: Divider to change long to float.
+    def get_offline_data(self) -> dict[str, Any]:
+        """Return data structure for offline inverter.
 
         Returns:
-            Value stored at location begin.
+            Dictionary with all sensor data set to offline/zero values.
         """
-        try:
-            if self._raw_msg:
-                return (
-                    float(struct.unpack("!I", self._raw_msg[begin : begin + 4])[0])
-                    / divider
-                )
-        except (struct.error, IndexError):
-            pass
-        return None
+        return _OFFLINE_DATA.copy()
 
     async def async_test_connection(self) -> bool:
         """Test connection to the inverter.
@@ -310,9 +414,9 @@ class TrannergyInverterApi:
             True if connection is successful.
 
         Raises:
-            TrannergyInverterConnectionError: If connection fails.
-            TrannergyInverterTimeoutError: If connection times out.
+            TrannergyInverterConnectionError: If the inverter cannot be reached.
         """
         await self.async_get_data()
+        if self._last_error is not None:
+            raise TrannergyInverterConnectionError(self._last_error)
         return True
-
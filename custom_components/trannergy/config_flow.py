@@ -13,11 +13,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
-from .api import (
-    TrannergyInverterApi,
-    TrannergyInverterConnectionError,
-    TrannergyInverterTimeoutError,
-)
+from .api import TrannergyInverterApi, TrannergyInverterConnectionError
 from .const import (
     CONF_INVERTER_HOST,
     CONF_INVERTER_PORT,
@@ -30,10 +26,23 @@ from .const import (
     DEFAULT_SENSORS,
     DOMAIN,
     SENSOR_KEYS,
+    SENSOR_KEYS_SET,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME, default=DEFAULT_NAME): str,
+        vol.Required(CONF_INVERTER_SERIAL): str,
+        vol.Required(CONF_INVERTER_HOST): str,
+        vol.Optional(CONF_INVERTER_PORT, default=DEFAULT_PORT): vol.Coerce(int),
+        vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.Coerce(
+            int
+        ),
+    }
+)
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
@@ -56,10 +65,12 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
 
     try:
         await api.async_test_connection()
-    except (TrannergyInverterConnectionError, TrannergyInverterTimeoutError) as err:
+    except TrannergyInverterConnectionError as err:
         _LOGGER.warning("Cannot connect to inverter: %s", err)
         # We don't raise an error here because the inverter might be offline at night
         # Instead, we allow the configuration to proceed
+    finally:
+        await api.async_close()
 
     return {"title": data.get(CONF_NAME, DEFAULT_NAME)}
 
@@ -105,20 +116,8 @@ class TrannergyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     )
 
         # Show form
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_NAME, default=DEFAULT_NAME): str,
-                vol.Required(CONF_INVERTER_SERIAL): str,
-                vol.Required(CONF_INVERTER_HOST): str,
-                vol.Optional(CONF_INVERTER_PORT, default=DEFAULT_PORT): vol.Coerce(int),
-                vol.Optional(
-                    CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL
-                ): vol.Coerce(int),
-            }
-        )
-
         return self.async_show_form(
-            step_id="user", data_schema=data_schema, errors=errors
+            step_id="user", data_schema=USER_SCHEMA, errors=errors
         )
 
     @staticmethod
@@ -141,7 +140,9 @@ class TrannergyOptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             # Convert selected sensors to list
             selected_sensors = [
-                key for key, value in user_input.items() if key in SENSOR_KEYS and value
+                key
+                for key, value in user_input.items()
+                if key in SENSOR_KEYS_SET and value
             ]
 
             # Get non-sensor options
@@ -42,6 +42,10 @@ SENSOR_KEYS = [
     "acoutputfrequency3",
     "acoutputpower3",
 ]
+SENSOR_KEYS_SET = frozenset(SENSOR_KEYS)
+
+# Sensor keys with a text value, all other sensors have a numeric value
+STRING_SENSOR_KEYS = frozenset({"status", "invertersn"})
 
 # Default sensors to enable
 DEFAULT_SENSORS = [
@@ -6,22 +6,23 @@ import logging
 from datetime import timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.storage import Store
 
-from .api import (
-    TrannergyInverterApi,
-    TrannergyInverterConnectionError,
-    TrannergyInverterTimeoutError,
-)
+from .api import TrannergyInverterApi
+from .const import DOMAIN, STRING_SENSOR_KEYS
 
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_VERSION = 1
 STORAGE_KEY = "trannergy_last_values"
 
+# Delay in seconds to coalesce writes of changed values to storage; pending
+# writes are flushed by the store when Home Assistant stops
+SAVE_DELAY = 60
+
 
 class TrannergyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching Trannergy data from the inverter."""
@@ -47,31 +48,61 @@ class TrannergyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             entry_id: Config entry ID for storage.
         """
         self.api = api
-        self._update_interval_seconds = update_interval
-        self._unsub_interval = None
+        # Device info shared by all sensors of the inverter
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, str(api.serial_number))},
+            name=name,
+            manufacturer="Trannergy",
+            model="PV Inverter",
+        )
         self._last_valid_data: dict[str, Any] = {}
         self._inverter_online = False
-        self._entry_id = entry_id
-        self._store: Store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry_id}")
+        self._offline_template = api.get_offline_data()
+        self._offline_data: dict[str, Any] | None = None
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry_id}", atomic_writes=True
+        )
+        self._last_saved_hash: int | None = None
+        self._save_pending = False
 
         super().__init__(
             hass,
             _LOGGER,
             name=name,
             update_interval=timedelta(seconds=update_interval),
+            # Skip entity updates when a poll returns unchanged data
+            always_update=False,
         )
 
     async def async_load_stored_data(self) -> None:
         """Load last valid data from storage."""
         stored = await self._store.async_load()
         if stored and isinstance(stored, dict):
-            self._last_valid_data = stored
+            # Store floats, so data compares equal to the values read from the inverter
+            self._last_valid_data = {
+                key: float(value)
+                for key, value in stored.items()
+                if key in self.PRESERVE_WHEN_OFFLINE and isinstance(value, (int, float))
+            }
+            self._last_saved_hash = hash(tuple(sorted(self._last_valid_data.items())))
             _LOGGER.debug("Loaded stored values: %s", self._last_valid_data)
 
-    async def _async_save_stored_data(self) -> None:
-        """Save last valid data to storage."""
-        await self._store.async_save(self._last_valid_data)
-        _LOGGER.debug("Saved values to storage: %s", self._last_valid_data)
+    def _schedule_save_stored_data(self) -> None:
+        """Schedule saving last valid data to storage, unless it is already stored."""
+        if self._save_pending:
+            # The pending save writes the latest values, don't postpone it
+            return
+        if hash(tuple(sorted(self._last_valid_data.items()))) == self._last_saved_hash:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the last valid data when the store writes it."""
+        self._save_pending = False
+        self._last_saved_hash = hash(tuple(sorted(self._last_valid_data.items())))
+        _LOGGER.debug("Saving values to storage: %s", self._last_valid_data)
+        return self._last_valid_data
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the inverter.
@@ -84,55 +115,81 @@ class TrannergyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         try:
             data = await self.api.async_get_data()
-            _LOGGER.debug("Successfully fetched data from inverter: %s", data)
-
-            # Check if inverter is online
-            if data.get("status") == "Online":
-                self._inverter_online = True
-                # Store valid data for sensors that should preserve values when offline
-                data_changed = False
-                for key in self.PRESERVE_WHEN_OFFLINE:
-                    if key in data and data[key] is not None and data[key] != 0.0:
-                        if self._last_valid_data.get(key) != data[key]:
-                            self._last_valid_data[key] = data[key]
-                            data_changed = True
-                # Persist to storage if values changed
-                if data_changed:
-                    await self._async_save_stored_data()
-            else:
-                self._inverter_online = False
-                # When offline, preserve last known values for TOTAL_INCREASING sensors
-                for key in self.PRESERVE_WHEN_OFFLINE:
-                    if key in self._last_valid_data:
-                        data[key] = self._last_valid_data[key]
-
-            return data
-        except TrannergyInverterTimeoutError as err:
-            # Inverter is likely offline (e.g., at night), return offline data
-            _LOGGER.debug("Inverter timeout (likely offline): %s", err)
-            self._inverter_online = False
-            return self._get_offline_data_with_preserved_values()
-        except TrannergyInverterConnectionError as err:
-            # Connection error, return offline data
-            _LOGGER.debug("Inverter connection error: %s", err)
-            self._inverter_online = False
-            return self._get_offline_data_with_preserved_values()
         except Exception as err:
             _LOGGER.exception("Unexpected error fetching data from inverter")
             raise UpdateFailed(f"Error fetching data from inverter: {err}") from err
 
+        # Check if inverter is online
+        if data.get("status") != "Online":
+            if self.api.last_error is not None:
+                # Inverter could not be reached, likely offline (e.g., at night)
+                _LOGGER.debug("Inverter not reachable: %s", self.api.last_error)
+            self._inverter_online = False
+            return self._get_offline_data_with_preserved_values()
+
+        data = self._coerce_data(data)
+        _LOGGER.debug("Successfully fetched data from inverter: %s", data)
+        self._inverter_online = True
+
+        # Store valid data for sensors that should preserve values when offline
+        data_changed = False
+        for key in self.PRESERVE_WHEN_OFFLINE:
+            if key in data and data[key] is not None and data[key] != 0.0:
+                if self._last_valid_data.get(key) != data[key]:
+                    self._last_valid_data[key] = data[key]
+                    data_changed = True
+        # Persist to storage if values changed, coalescing frequent changes
+        if data_changed:
+            self._schedule_save_stored_data()
+
+        return data
+
+    @staticmethod
+    def _coerce_data(data: dict[str, Any]) -> dict[str, Any]:
+        """Coerce the values read from the inverter to their sensor types.
+
+        Text sensors get a string, numeric sensors a float or None if the
+        value cannot be converted.
+
+        Args:
+            data: Data read from the inverter.
+
+        Returns:
+            Dictionary with typed sensor data.
+        """
+        coerced: dict[str, Any] = {}
+        for key, value in data.items():
+            if key in STRING_SENSOR_KEYS:
+                coerced[key] = "" if value is None else str(value)
+                continue
+            try:
+                coerced[key] = float(value)
+            except (ValueError, TypeError):
+                coerced[key] = None
+        return coerced
+
     def _get_offline_data_with_preserved_values(self) -> dict[str, Any]:
         """Get offline data while preserving TOTAL_INCREASING sensor values.
 
+        The returned dictionary is shared between calls and must not be modified.
+
         Returns:
             Dictionary with offline status and preserved values.
         """
-        data = self.api._get_offline_data()
-
-        # Preserve last known values for TOTAL_INCREASING sensors
-        for key in self.PRESERVE_WHEN_OFFLINE:
-            if key in self._last_valid_data:
-                data[key] = self._last_valid_data[key]
+        preserved = {
+            key: self._last_valid_data[key]
+            for key in self.PRESERVE_WHEN_OFFLINE
+            if key in self._last_valid_data
+        }
+
+        # Reuse the previous offline data while the preserved values are unchanged,
+        # so the coordinator sees identical data and skips updating the entities
+        data = self._offline_data
+        if data is None or any(data[key] != value for key, value in preserved.items()):
+            data = self._offline_template.copy()
+            # Preserve last known values for TOTAL_INCREASING sensors
+            data.update(preserved)
+            self._offline_data = data
 
         return data
 
@@ -141,26 +198,14 @@ class TrannergyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Return whether the inverter is currently online."""
         return self._inverter_online
 
-    @callback
-    def async_setup_interval(self) -> None:
-        """Set up the update interval using async_track_time_interval."""
-        if self._unsub_interval is not None:
-            self._unsub_interval()
-
-        async def _async_refresh(_: Any) -> None:
-            """Refresh data from the inverter."""
-            await self.async_refresh()
-
-        self._unsub_interval = async_track_time_interval(
-            self.hass,
-            _async_refresh,
-            timedelta(seconds=self._update_interval_seconds),
-        )
-
-    @callback
-    def async_unload(self) -> None:
-        """Unload the coordinator."""
-        if self._unsub_interval is not None:
-            self._unsub_interval()
-            self._unsub_interval = None
+    async def async_shutdown(self) -> None:
+        """Shut down the coordinator and close the inverter connection.
 
+        Values not yet in storage are written right away, so a reloaded entry
+        loads the latest values.
+        """
+        await super().async_shutdown()
+        if hash(tuple(sorted(self._last_valid_data.items()))) != self._last_saved_hash:
+            # Also cancels the pending delayed save
+            await self._store.async_save(self._data_to_save())
+        await self.api.async_close()
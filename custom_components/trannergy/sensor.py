@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -11,9 +12,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -27,202 +26,260 @@ from .coordinator import TrannergyDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-# Sensor definitions: key -> [name, unit, icon, device_class, state_class, precision]
-SENSOR_TYPES: dict[str, list] = {
-    "status": ["Status", None, "mdi:weather-sunny", None, None, None],
-    "actualpower": [
-        "Actual Power",
-        "W",
-        "mdi:solar-power",
-        SensorDeviceClass.POWER,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "energytoday": [
-        "Energy Today",
-        "kWh",
-        "mdi:chart-bell-curve-cumulative",
-        SensorDeviceClass.ENERGY,
-        None,
-        2,
-    ],
-    "energytotal": [
-        "Energy Total",
-        "kWh",
-        "mdi:meter-electric-outline",
-        SensorDeviceClass.ENERGY,
-        SensorStateClass.TOTAL_INCREASING,
-        1,
-    ],
-    "hourstotal": [
-        "Hours Total",
-        "h",
-        "mdi:timer-outline",
-        SensorDeviceClass.DURATION,
-        SensorStateClass.TOTAL_INCREASING,
-        None,
-    ],
-    "invertersn": [
-        "Inverter Serial Number",
-        None,
-        "mdi:information-outline",
-        None,
-        None,
-        None,
-    ],
-    "temperature": [
-        "Temperature",
-        "°C",
-        "mdi:thermometer",
-        SensorDeviceClass.TEMPERATURE,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "dcinputvoltage1": [
-        "DC Input Voltage 1",
-        "V",
-        "mdi:flash-outline",
-        SensorDeviceClass.VOLTAGE,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "dcinputcurrent1": [
-        "DC Input Current 1",
-        "A",
-        "mdi:current-dc",
-        SensorDeviceClass.CURRENT,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "dcinputvoltage2": [
-        "DC Input Voltage 2",
-        "V",
-        "mdi:flash-outline",
-        SensorDeviceClass.VOLTAGE,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "dcinputcurrent2": [
-        "DC Input Current 2",
-        "A",
-        "mdi:current-dc",
-        SensorDeviceClass.CURRENT,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "dcinputvoltage3": [
-        "DC Input Voltage 3",
-        "V",
-        "mdi:flash-outline",
-        SensorDeviceClass.VOLTAGE,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "dcinputcurrent3": [
-        "DC Input Current 3",
-        "A",
-        "mdi:current-dc",
-        SensorDeviceClass.CURRENT,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "acoutputvoltage1": [
-        "AC Output Voltage 1",
-        "V",
-        "mdi:flash-outline",
-        SensorDeviceClass.VOLTAGE,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "acoutputcurrent1": [
-        "AC Output Current 1",
-        "A",
-        "mdi:current-ac",
-        SensorDeviceClass.CURRENT,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "acoutputfrequency1": [
-        "AC Output Frequency 1",
-        "Hz",
-        "mdi:sine-wave",
-        SensorDeviceClass.FREQUENCY,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "acoutputpower1": [
-        "AC Output Power 1",
-        "W",
-        "mdi:solar-power",
-        SensorDeviceClass.POWER,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "acoutputvoltage2": [
-        "AC Output Voltage 2",
-        "V",
-        "mdi:flash-outline",
-        SensorDeviceClass.VOLTAGE,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "acoutputcurrent2": [
-        "AC Output Current 2",
-        "A",
-        "mdi:current-ac",
-        SensorDeviceClass.CURRENT,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "acoutputfrequency2": [
-        "AC Output Frequency 2",
-        "Hz",
-        "mdi:sine-wave",
-        SensorDeviceClass.FREQUENCY,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "acoutputpower2": [
-        "AC Output Power 2",
-        "W",
-        "mdi:solar-power",
-        SensorDeviceClass.POWER,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "acoutputvoltage3": [
-        "AC Output Voltage 3",
-        "V",
-        "mdi:flash-outline",
-        SensorDeviceClass.VOLTAGE,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "acoutputcurrent3": [
-        "AC Output Current 3",
-        "A",
-        "mdi:current-ac",
-        SensorDeviceClass.CURRENT,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "acoutputfrequency3": [
-        "AC Output Frequency 3",
-        "Hz",
-        "mdi:sine-wave",
-        SensorDeviceClass.FREQUENCY,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-    "acoutputpower3": [
-        "AC Output Power 3",
-        "W",
-        "mdi:solar-power",
-        SensorDeviceClass.POWER,
-        SensorStateClass.MEASUREMENT,
-        None,
-    ],
-}
+
+@dataclass(frozen=True, slots=True)
+class SensorSpec:
+    """Description of a Trannergy sensor."""
+
+    key: str
+    name: str
+    unit: str | None
+    icon: str
+    device_class: SensorDeviceClass | None = None
+    state_class: SensorStateClass | None = None
+    precision: int | None = None
+
+
+# Sensor definitions
+_SENSOR_SPECS: tuple[SensorSpec, ...] = (
+    SensorSpec(
+        key="status",
+        name="Status",
+        unit=None,
+        icon="mdi:weather-sunny",
+    ),
+    SensorSpec(
+        key="actualpower",
+        name="Actual Power",
+        unit="W",
+        icon="mdi:solar-power",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="energytoday",
+        name="Energy Today",
+        unit="kWh",
+        icon="mdi:chart-bell-curve-cumulative",
+        device_class=SensorDeviceClass.ENERGY,
+        precision=2,
+    ),
+    SensorSpec(
+        key="energytotal",
+        name="Energy Total",
+        unit="kWh",
+        icon="mdi:meter-electric-outline",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        precision=1,
+    ),
+    SensorSpec(
+        key="hourstotal",
+        name="Hours Total",
+        unit="h",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorSpec(
+        key="invertersn",
+        name="Inverter Serial Number",
+        unit=None,
+        icon="mdi:information-outline",
+    ),
+    SensorSpec(
+        key="temperature",
+        name="Temperature",
+        unit="°C",
+        icon="mdi:thermometer",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="dcinputvoltage1",
+        name="DC Input Voltage 1",
+        unit="V",
+        icon="mdi:flash-outline",
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="dcinputcurrent1",
+        name="DC Input Current 1",
+        unit="A",
+        icon="mdi:current-dc",
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="dcinputvoltage2",
+        name="DC Input Voltage 2",
+        unit="V",
+        icon="mdi:flash-outline",
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="dcinputcurrent2",
+        name="DC Input Current 2",
+        unit="A",
+        icon="mdi:current-dc",
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="dcinputvoltage3",
+        name="DC Input Voltage 3",
+        unit="V",
+        icon="mdi:flash-outline",
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="dcinputcurrent3",
+        name="DC Input Current 3",
+        unit="A",
+        icon="mdi:current-dc",
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="acoutputvoltage1",
+        name="AC Output Voltage 1",
+        unit="V",
+        icon="mdi:flash-outline",
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="acoutputcurrent1",
+        name="AC Output Current 1",
+        unit="A",
+        icon="mdi:current-ac",
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="acoutputfrequency1",
+        name="AC Output Frequency 1",
+        unit="Hz",
+        icon="mdi:sine-wave",
+        device_class=SensorDeviceClass.FREQUENCY,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="acoutputpower1",
+        name="AC Output Power 1",
+        unit="W",
+        icon="mdi:solar-power",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="acoutputvoltage2",
+        name="AC Output Voltage 2",
+        unit="V",
+        icon="mdi:flash-outline",
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="acoutputcurrent2",
+        name="AC Output Current 2",
+        unit="A",
+        icon="mdi:current-ac",
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="acoutputfrequency2",
+        name="AC Output Frequency 2",
+        unit="Hz",
+        icon="mdi:sine-wave",
+        device_class=SensorDeviceClass.FREQUENCY,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="acoutputpower2",
+        name="AC Output Power 2",
+        unit="W",
+        icon="mdi:solar-power",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="acoutputvoltage3",
+        name="AC Output Voltage 3",
+        unit="V",
+        icon="mdi:flash-outline",
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="acoutputcurrent3",
+        name="AC Output Current 3",
+        unit="A",
+        icon="mdi:current-ac",
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="acoutputfrequency3",
+        name="AC Output Frequency 3",
+        unit="Hz",
+        icon="mdi:sine-wave",
+        device_class=SensorDeviceClass.FREQUENCY,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        key="acoutputpower3",
+        name="AC Output Power 3",
+        unit="W",
+        icon="mdi:solar-power",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+)
+
+# Sensor definitions, keyed by the key of the sensor in the data dictionary
+SENSOR_TYPES: dict[str, SensorSpec] = {spec.key: spec for spec in _SENSOR_SPECS}
+
+
+def _resolve_status(coordinator: TrannergyDataUpdateCoordinator, key: str) -> Any:
+    """Return the state of the status sensor."""
+    if coordinator.data is None:
+        return "Offline"
+    return coordinator.data.get(key) or "Offline"
+
+
+def _resolve_serial(coordinator: TrannergyDataUpdateCoordinator, key: str) -> Any:
+    """Return the state of the inverter serial sensor."""
+    if coordinator.data is None:
+        return None
+    return coordinator.data.get(key) or ""
+
+
+def _resolve_total(coordinator: TrannergyDataUpdateCoordinator, key: str) -> Any:
+    """Return the state of a TOTAL_INCREASING sensor.
+
+    These sensors NEVER return 0 but None instead, as a 0 would corrupt the
+    long-term statistics.
+    """
+    if coordinator.data is None:
+        return None
+    value = coordinator.data.get(key)
+    return value if value is not None and value > 0 else None
+
+
+def _resolve_measurement(
+    coordinator: TrannergyDataUpdateCoordinator, key: str
+) -> Any:
+    """Return the state of a measurement sensor."""
+    # When offline, return None to make the sensor unavailable
+    if coordinator.data is None or not coordinator.inverter_online:
+        return None
+    value = coordinator.data.get(key)
+    return 0.0 if value is None else value
 
 
 async def async_setup_entry(
@@ -244,29 +301,19 @@ async def async_setup_entry(
         CONF_SENSORS, entry.data.get(CONF_SENSORS, DEFAULT_SENSORS)
     )
 
-    name = entry.data.get(CONF_NAME, "Trannergy")
     serial = entry.data[CONF_INVERTER_SERIAL]
 
-    entities: list[TrannergySensor] = []
-
-    for sensor_key in configured_sensors:
-        if sensor_key in SENSOR_TYPES:
-            sensor_info = SENSOR_TYPES[sensor_key]
-            entities.append(
-                TrannergySensor(
-                    coordinator=coordinator,
-                    entry=entry,
-                    sensor_key=sensor_key,
-                    sensor_name=sensor_info[0],
-                    sensor_unit=sensor_info[1],
-                    sensor_icon=sensor_info[2],
-                    sensor_device_class=sensor_info[3],
-                    sensor_state_class=sensor_info[4],
-                    sensor_precision=sensor_info[5],
-                    inverter_name=name,
-                    inverter_serial=serial,
-                )
-            )
+    # Skip configured keys without a sensor definition, keeping the configured order
+    entities: list[TrannergySensor] = [
+        TrannergySensor(
+            coordinator=coordinator,
+            entry=entry,
+            spec=SENSOR_TYPES[sensor_key],
+            inverter_serial=serial,
+        )
+        for sensor_key in configured_sensors
+        if sensor_key in SENSOR_TYPES
+    ]
 
     async_add_entities(entities)
 
@@ -274,20 +321,21 @@ async def async_setup_entry(
 class TrannergySensor(CoordinatorEntity[TrannergyDataUpdateCoordinator], SensorEntity):
     """Representation of a Trannergy sensor."""
 
+    __slots__ = (
+        "_sensor_key",
+        "_inverter_serial",
+        "_is_status",
+        "_is_total_increasing",
+        "_resolve",
+    )
+
     _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: TrannergyDataUpdateCoordinator,
         entry: ConfigEntry,
-        sensor_key: str,
-        sensor_name: str,
-        sensor_unit: str | None,
-        sensor_icon: str,
-        sensor_device_class: SensorDeviceClass | None,
-        sensor_state_class: SensorStateClass | None,
-        sensor_precision: int | None,
-        inverter_name: str,
+        spec: SensorSpec,
         inverter_serial: int,
     ) -> None:
         """Initialize the sensor.
@@ -295,90 +343,69 @@ class TrannergySensor(CoordinatorEntity[TrannergyDataUpdateCoordinator], SensorE
         Args:
             coordinator: Data update coordinator.
             entry: Config entry.
-            sensor_key: Key of the sensor in the data dictionary.
-            sensor_name: Human-readable name of the sensor.
-            sensor_unit: Unit of measurement.
-            sensor_icon: Icon for the sensor.
-            sensor_device_class: Device class of the sensor.
-            sensor_state_class: State class of the sensor.
-            sensor_precision: Number of decimal places for display.
-            inverter_name: Name of the inverter.
+            spec: Description of the sensor.
             inverter_serial: Serial number of the inverter.
         """
         super().__init__(coordinator)
 
+        # The key from the spec is the same string object as the keys in the
+        # coordinator data, unlike the key stored in the config entry
+        sensor_key = spec.key
         self._sensor_key = sensor_key
         self._inverter_serial = inverter_serial
+        self._is_status = sensor_key == "status"
+        self._is_total_increasing = (
+            spec.state_class is SensorStateClass.TOTAL_INCREASING
+        )
+        if self._is_status:
+            self._resolve = _resolve_status
+        elif sensor_key == "invertersn":
+            self._resolve = _resolve_serial
+        elif self._is_total_increasing:
+            self._resolve = _resolve_total
+        else:
+            self._resolve = _resolve_measurement
 
         # Entity attributes
-        self._attr_name = sensor_name
+        self._attr_name = spec.name
         self._attr_unique_id = f"{inverter_serial}_{sensor_key}"
-        self._attr_native_unit_of_measurement = sensor_unit
-        self._attr_icon = sensor_icon
-        self._attr_device_class = sensor_device_class
-        self._attr_state_class = sensor_state_class
-        if sensor_precision is not None:
-            self._attr_suggested_display_precision = sensor_precision
+        self._attr_native_unit_of_measurement = spec.unit
+        self._attr_icon = spec.icon
+        self._attr_device_class = spec.device_class
+        self._attr_state_class = spec.state_class
+        if spec.precision is not None:
+            self._attr_suggested_display_precision = spec.precision
 
         # Device info
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, str(inverter_serial))},
-            name=inverter_name,
-            manufacturer="Trannergy",
-            model="PV Inverter",
-        )
+        self._attr_device_info = coordinator.device_info
 
-    @property
-    def native_value(self) -> Any:
-        """Return the state of the sensor.
+        self._update_state()
 
-        Returns:
-            Current value of the sensor.
-        """
-        if self.coordinator.data is None:
-            if self._sensor_key == "status":
-                return "Offline"
-            # Return None for other sensors when no data available
-            return None
-
-        value = self.coordinator.data.get(self._sensor_key)
-
-        # Handle status sensor
-        if self._sensor_key == "status":
-            return str(value) if value else "Offline"
-
-        # Handle inverter serial
-        if self._sensor_key == "invertersn":
-            return str(value) if value else ""
-
-        # For TOTAL_INCREASING sensors, NEVER return 0 - return None instead
-        # This prevents corrupting long-term statistics
-        if self._attr_state_class == SensorStateClass.TOTAL_INCREASING:
-            if value is None or value == 0.0:
-                return None
-            try:
-                float_val = float(value)
-                return float_val if float_val > 0 else None
-            except (ValueError, TypeError):
-                return None
-
-        # For other sensors when offline, return None to make them unavailable
-        if not self.coordinator.inverter_online:
-            return None
-
-        # For numeric values when online, ensure we return a float
-        if value is None:
-            return 0.0
-
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return 0.0
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_state()
+        super()._handle_coordinator_update()
+
+    def _update_state(self) -> None:
+        """Compute state and availability once per coordinator update."""
+        self._attr_native_value = self._resolve(self.coordinator, self._sensor_key)
+        self._attr_available = self._compute_available()
 
     @property
     def available(self) -> bool:
         """Return True if entity is available.
 
+        Overrides CoordinatorEntity, which only reports the coordinator status.
+
+        Returns:
+            Availability computed at the last coordinator update.
+        """
+        return self._attr_available
+
+    def _compute_available(self) -> bool:
+        """Compute whether the entity is available.
+
         Returns:
             True if the coordinator has data and sensor should be available.
         """
@@ -386,18 +413,13 @@ class TrannergySensor(CoordinatorEntity[TrannergyDataUpdateCoordinator], SensorE
             return False
 
         # Status sensor is always available when coordinator is working
-        if self._sensor_key == "status":
+        if self._is_status:
             return True
 
         # TOTAL_INCREASING sensors are only available if they have a valid non-zero value
-        if self._attr_state_class == SensorStateClass.TOTAL_INCREASING:
+        if self._is_total_increasing:
             value = self.coordinator.data.get(self._sensor_key) if self.coordinator.data else None
-            if value is None or value == 0.0:
-                return False
-            try:
-                return float(value) > 0
-            except (ValueError, TypeError):
-                return False
+            return value is not None and value > 0
 
         # Other sensors are only available when the inverter is online
         return self.coordinator.inverter_online